@@ -0,0 +1,194 @@
+# python/dead_frame_detector.py
+
+import json
+import subprocess
+import tempfile
+
+import numpy as np
+
+# Frames are analysed at this size; dead-frame detection only needs coarse luma,
+# and a tiny frame keeps both the decode pipe and the NumPy work cheap.
+ANALYSIS_WIDTH = 128
+ANALYSIS_HEIGHT = 72
+
+def probe_frame_rate(video_path):
+    """Returns the average frame rate of the first video stream using ffprobe."""
+    command = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=avg_frame_rate,r_frame_rate',
+        '-of', 'json',
+        video_path
+    ]
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    stream = json.loads(result.stdout)['streams'][0]
+
+    for key in ('avg_frame_rate', 'r_frame_rate'):
+        num, _, den = stream.get(key, '0/0').partition('/')
+        if float(den or 1) > 0 and float(num) > 0:
+            return float(num) / float(den or 1)
+    raise ValueError(f"Could not determine frame rate of {video_path}")
+
+def iter_gray_chunks(video_path, chunk_frames=512, width=ANALYSIS_WIDTH, height=ANALYSIS_HEIGHT):
+    """
+    Decodes a downscaled grayscale stream of the video through FFmpeg and yields it
+    as uint8 arrays of shape (frames, height, width), at most chunk_frames at a time.
+    """
+    command = [
+        'ffmpeg',
+        '-v', 'error',
+        # Deblocking and exact IDCT rounding don't matter once frames are shrunk
+        # to a thumbnail, and skipping them speeds up decoding noticeably.
+        '-skip_loop_filter', 'all',
+        '-flags2', 'fast',
+        '-i', video_path,
+        '-an', '-sn',
+        '-vf', f'scale={width}:{height}:flags=area,format=gray',
+        '-vsync', 'passthrough',
+        '-f', 'rawvideo',
+        '-pix_fmt', 'gray',
+        'pipe:1'
+    ]
+    frame_size = width * height
+    # stderr goes to a temporary file rather than a pipe so a chatty decoder can't
+    # block while we are reading frames from stdout.
+    with tempfile.TemporaryFile() as stderr_file:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file)
+        try:
+            while True:
+                data = process.stdout.read(frame_size * chunk_frames)
+                frame_count = len(data) // frame_size
+                if frame_count == 0:
+                    break
+                chunk = np.frombuffer(data, dtype=np.uint8, count=frame_count * frame_size)
+                yield chunk.reshape(frame_count, height, width)
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+
+        if returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace')
+            raise subprocess.CalledProcessError(returncode, command, stderr=stderr)
+
+def compute_frame_stats(video_path, chunk_frames=512):
+    """
+    Returns per-frame (mean_luma, max_diff) arrays for the video.
+
+    max_diff[i] is the largest per-pixel luma difference between frame i and frame i-1,
+    so a small moving object keeps a frame from looking still even when the rest of the
+    view is static. max_diff[0] is 256 since the first frame has nothing to repeat.
+    """
+    means = []
+    max_diffs = []
+    previous = None
+    for chunk in iter_gray_chunks(video_path, chunk_frames):
+        means.append(chunk.mean(axis=(1, 2)))
+
+        frames = chunk if previous is None else np.concatenate((previous, chunk))
+        diffs = np.abs(np.diff(frames.astype(np.int16), axis=0)).max(axis=(1, 2))
+        if previous is None:
+            diffs = np.concatenate(([256], diffs))
+        max_diffs.append(diffs)
+        previous = chunk[-1:]
+
+    if not means:
+        return np.empty(0), np.empty(0, dtype=np.int16)
+    return np.concatenate(means), np.concatenate(max_diffs)
+
+def _find_runs(mask, min_length):
+    """Returns (start, end) frame index pairs, end exclusive, of True runs at least min_length long."""
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= max(min_length, 1)
+    return list(zip(starts[keep].tolist(), ends[keep].tolist()))
+
+def _bridge_gaps(mask, max_gap):
+    """Returns a copy of mask with False runs of at most max_gap frames between True runs filled in."""
+    bridged = mask.copy()
+    for start, end in _find_runs(~mask, 1):
+        if start > 0 and end < len(mask) and end - start <= max_gap:
+            bridged[start:end] = True
+    return bridged
+
+def merge_segments(segments):
+    """Merges overlapping or touching segments into sorted (start, end) cut ranges in seconds."""
+    merged = []
+    for start, end in sorted((segment['start'], segment['end']) for segment in segments):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+def invert_ranges(cut_ranges, duration, min_keep_duration=0.2):
+    """
+    Returns the (start, end) ranges of a clip of the given duration that are left
+    after removing cut_ranges. Fragments shorter than min_keep_duration are dropped.
+    """
+    keep_ranges = []
+    position = 0.0
+    for start, end in list(cut_ranges) + [(duration, duration)]:
+        if start - position >= min_keep_duration:
+            keep_ranges.append((position, start))
+        position = max(position, end)
+    return keep_ranges
+
+def detect_dead_segments(video_path,
+                         black_threshold=16.0,
+                         freeze_threshold=3,
+                         min_black_duration=0.1,
+                         min_freeze_duration=0.5,
+                         max_gap_frames=1,
+                         chunk_frames=512):
+    """
+    Scans a clip for black, frozen and duplicate-frame runs.
+
+    A run of still frames is reported as 'duplicate' when every frame in it is a
+    bit-identical repeat of the one before (e.g. a capture stall), and as 'frozen'
+    when encoder noise still changes it slightly. Short gaps inside a still run are
+    bridged, since an encoder keyframe re-quantizes an unchanged picture and makes a
+    few pixels jump for a single frame.
+
+    Args:
+        video_path: Path of the clip to scan
+        black_threshold: Mean luma (0-255) below which a frame counts as black
+        freeze_threshold: Largest per-pixel luma change (0-255) at which a frame still counts as a repeat
+        min_black_duration: Shortest black run, in seconds, that is reported
+        min_freeze_duration: Shortest frozen or duplicate run, in seconds, that is reported
+        max_gap_frames: Longest run of changed frames that is bridged inside a still run
+        chunk_frames: Number of frames decoded into memory at a time
+
+    Returns:
+        A dict with 'fps', 'duration' and 'segments', a list of
+        {'kind', 'start', 'end'} entries in seconds sorted by start time.
+    """
+    fps = probe_frame_rate(video_path)
+    means, max_diffs = compute_frame_stats(video_path, chunk_frames)
+
+    # Black frames are excluded from the still-image check so a black screen is
+    # reported once as black rather than also as frozen.
+    black = means < black_threshold
+    still = _bridge_gaps((max_diffs <= freeze_threshold) & ~black, max_gap_frames)
+    exact = max_diffs == 0
+
+    segments = []
+    for start, end in _find_runs(black, round(min_black_duration * fps)):
+        segments.append({'kind': 'black', 'start': start / fps, 'end': end / fps})
+    for start, end in _find_runs(still, round(min_freeze_duration * fps)):
+        kind = 'duplicate' if exact[start:end].all() else 'frozen'
+        segments.append({'kind': kind, 'start': start / fps, 'end': end / fps})
+
+    segments.sort(key=lambda segment: (segment['start'], segment['end']))
+    return {'fps': fps, 'duration': len(means) / fps, 'segments': segments}
+
+def get_cut_ranges(video_path, **kwargs):
+    """Returns merged (start, end) ranges in seconds that should be cut from the clip."""
+    return merge_segments(detect_dead_segments(video_path, **kwargs)['segments'])
+
+def get_keep_ranges(video_path, min_keep_duration=0.2, **kwargs):
+    """Returns (start, end) ranges in seconds of the clip that remain after removing dead segments."""
+    result = detect_dead_segments(video_path, **kwargs)
+    return invert_ranges(merge_segments(result['segments']), result['duration'], min_keep_duration)
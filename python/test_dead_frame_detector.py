@@ -0,0 +1,169 @@
+# python/test_dead_frame_detector.py
+
+import shutil
+import subprocess
+import time
+
+import pytest
+
+pytest.importorskip('numpy')
+
+if not shutil.which('ffmpeg') or not shutil.which('ffprobe'):
+    pytest.skip("ffmpeg and ffprobe are required", allow_module_level=True)
+
+from dead_frame_detector import detect_dead_segments, get_cut_ranges, get_keep_ranges
+from video_stitcher import stitch_clips
+
+FPS = 30
+SIZE = '1280x720'
+FRAME = 1 / FPS
+
+def x264(gop):
+    """Encodes like an OBS recording: fixed keyframe interval, no scene-cut keyframes."""
+    return ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '23', '-pix_fmt', 'yuv420p',
+            '-g', str(gop), '-sc_threshold', '0']
+
+# A 2 s keyframe interval at 30 fps, as OBS uses by default.
+X264 = x264(60)
+
+def make_clip(path, sources, filter_graph, codec=X264):
+    """Renders lavfi sources through a filter graph whose output is labelled [v]."""
+    command = ['ffmpeg', '-v', 'error']
+    for source in sources:
+        command += ['-f', 'lavfi', '-i', source]
+    command += ['-filter_complex', filter_graph, '-map', '[v]'] + codec + ['-y', str(path)]
+    subprocess.run(command, check=True)
+    return str(path)
+
+def live(duration):
+    return f'testsrc2=s={SIZE}:r={FPS}:d={duration}'
+
+@pytest.fixture
+def black_clip(tmp_path):
+    """2 s of motion, 1 s of black, 2 s of motion."""
+    return make_clip(
+        tmp_path / 'black.mp4',
+        [live(2), f'color=black:s={SIZE}:r={FPS}:d=1', live(2)],
+        '[0:v][1:v][2:v]concat=n=3:v=1[v]'
+    )
+
+# The freezes run from 1.5 to 2.5 s, so the keyframe at 2.0 s falls inside them.
+FREEZE = '[0:v]tpad=stop_mode=clone:stop_duration=1[a];[a][1:v]concat=n=2:v=1[v]'
+
+@pytest.fixture
+def frozen_clip(tmp_path):
+    """1.5 s of motion, the last frame held for 1 s, 2 s of motion."""
+    return make_clip(tmp_path / 'frozen.mp4', [live(1.5), live(2)], FREEZE)
+
+@pytest.fixture
+def duplicate_clip(tmp_path):
+    """1.5 s of motion, the last frame repeated exactly for 1 s, 2 s of motion (lossless)."""
+    return make_clip(tmp_path / 'duplicate.mkv', [live(1.5), live(2)], FREEZE, codec=['-c:v', 'ffv1'])
+
+def assert_single_segment(result, kind, start, end):
+    assert [segment['kind'] for segment in result['segments']] == [kind]
+    segment = result['segments'][0]
+    assert segment['start'] == pytest.approx(start, abs=FRAME)
+    assert segment['end'] == pytest.approx(end, abs=FRAME)
+
+def test_detects_black_run(black_clip):
+    result = detect_dead_segments(black_clip)
+    assert result['duration'] == pytest.approx(5.0, abs=FRAME)
+    assert_single_segment(result, 'black', 2.0, 3.0)
+
+def test_detects_frozen_run(frozen_clip):
+    assert_single_segment(detect_dead_segments(frozen_clip), 'frozen', 1.5, 2.5)
+
+def test_detects_duplicate_run(duplicate_clip):
+    assert_single_segment(detect_dead_segments(duplicate_clip), 'duplicate', 1.5, 2.5)
+
+def test_freeze_across_keyframe_at_60_fps(tmp_path):
+    # 1080p60 with a 2 s GOP; the 0.9 s freeze straddles the keyframe at 2.0 s.
+    sources = [f'testsrc2=s=1920x1080:r=60:d={duration}' for duration in (1.5, 2)]
+    clip = make_clip(
+        tmp_path / 'frozen60.mp4',
+        sources,
+        '[0:v]tpad=stop_mode=clone:stop_duration=0.9[a];[a][1:v]concat=n=2:v=1[v]',
+        codec=x264(120)
+    )
+    result = detect_dead_segments(clip)
+    assert [segment['kind'] for segment in result['segments']] == ['frozen']
+    assert result['segments'][0]['start'] == pytest.approx(1.5, abs=1 / 60)
+    assert result['segments'][0]['end'] == pytest.approx(2.4, abs=1 / 60)
+
+def test_continuous_motion_is_not_frozen(tmp_path):
+    # testsrc only moves a slow gradient each frame, which a whole-frame mean misses.
+    clip = make_clip(tmp_path / 'testsrc.mp4', [f'testsrc=s={SIZE}:r={FPS}:d=4'], '[0:v]null[v]')
+    assert detect_dead_segments(clip)['segments'] == []
+    assert get_keep_ranges(clip) == [(0.0, pytest.approx(4.0, abs=FRAME))]
+
+def test_short_freeze_is_ignored(tmp_path):
+    clip = make_clip(
+        tmp_path / 'short_freeze.mp4',
+        [live(2), live(2)],
+        '[0:v]tpad=stop_mode=clone:stop_duration=0.2[a];[a][1:v]concat=n=2:v=1[v]'
+    )
+    assert detect_dead_segments(clip)['segments'] == []
+
+def test_cut_and_keep_ranges(black_clip):
+    cut_ranges = get_cut_ranges(black_clip)
+    keep_ranges = get_keep_ranges(black_clip)
+    assert cut_ranges == [(pytest.approx(2.0, abs=FRAME), pytest.approx(3.0, abs=FRAME))]
+    assert keep_ranges == [
+        (0.0, pytest.approx(2.0, abs=FRAME)),
+        (pytest.approx(3.0, abs=FRAME), pytest.approx(5.0, abs=FRAME)),
+    ]
+
+@pytest.mark.parametrize('clip_fixture', ['black_clip', 'frozen_clip', 'duplicate_clip'])
+def test_chunk_boundaries_do_not_change_result(request, clip_fixture):
+    clip = request.getfixturevalue(clip_fixture)
+    assert detect_dead_segments(clip, chunk_frames=7) == detect_dead_segments(clip)
+
+def test_scan_costs_about_one_decode(tmp_path):
+    # Decoding dominates and its speed depends on the machine, so compare against
+    # FFmpeg decoding the same clip rather than against real time.
+    clip = make_clip(tmp_path / 'long.mp4', [f'testsrc2=s={SIZE}:r=60:d=20'], '[0:v]null[v]')
+
+    started = time.perf_counter()
+    subprocess.run(['ffmpeg', '-v', 'error', '-i', clip, '-f', 'null', '-'], check=True)
+    decode_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    detect_dead_segments(clip)
+    scan_elapsed = time.perf_counter() - started
+
+    assert scan_elapsed <= 1.5 * decode_elapsed
+
+def test_stitch_removes_dead_frames(tmp_path, black_clip, frozen_clip):
+    output_path = str(tmp_path / 'reel.mp4')
+    stitch_clips([black_clip, frozen_clip], output_path, cleanup=False, remove_dead_frames=True)
+
+    result = detect_dead_segments(output_path)
+    assert result['segments'] == []
+    assert result['fps'] == pytest.approx(FPS)
+    assert result['duration'] == pytest.approx(7.5, abs=2 * FRAME)
+
+def test_stitch_mixed_frame_rates_and_audio(tmp_path, black_clip, capsys):
+    clip_60 = str(tmp_path / 'clip60.mp4')
+    subprocess.run(
+        ['ffmpeg', '-v', 'error', '-f', 'lavfi', '-i', f'testsrc2=s={SIZE}:r=60:d=2',
+         '-f', 'lavfi', '-i', 'sine=d=2'] + x264(120) + ['-c:a', 'aac', '-shortest', '-y', clip_60],
+        check=True
+    )
+    output_path = str(tmp_path / 'reel.mp4')
+    stitch_clips([black_clip, clip_60], output_path, cleanup=False, remove_dead_frames=True)
+
+    out = capsys.readouterr().out
+    assert "encoding the reel at 60 fps" in out
+    assert "Dropping audio from the reel" in out
+    result = detect_dead_segments(output_path)
+    assert result['fps'] == pytest.approx(60)
+    assert result['duration'] == pytest.approx(6.0, abs=2 * FRAME)
+
+def test_stitch_skips_when_nothing_is_left(tmp_path, capsys):
+    clip = make_clip(tmp_path / 'all_black.mp4', [f'color=black:s={SIZE}:r={FPS}:d=2'], '[0:v]null[v]')
+    output_path = tmp_path / 'reel.mp4'
+    stitch_clips([clip], str(output_path), cleanup=False, remove_dead_frames=True)
+
+    assert not output_path.exists()
+    assert "No usable frames left to stitch." in capsys.readouterr().out
@@ -3,18 +3,119 @@
 import subprocess
 import os
 
-def stitch_clips(clip_paths, output_path, cleanup=True):
+def has_audio_stream(video_path):
+    """Returns True if the file has at least one audio stream, using ffprobe."""
+    command = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'a',
+        '-show_entries', 'stream=index',
+        '-of', 'csv=p=0',
+        video_path
+    ]
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    return bool(result.stdout.strip())
+
+def stitch_ranges(clip_ranges, output_path):
+    """
+    Re-encodes the given (clip_path, [(start, end), ...]) ranges into a single video.
+
+    Stream copy can only cut on keyframes, so trimming out dead frames needs a
+    trim + concat filter graph. Audio is kept when every clip has an audio stream.
+    The reel uses the highest frame rate among the clips so no frames are dropped.
+    """
+    from dead_frame_detector import probe_frame_rate
+
+    frame_rates = [probe_frame_rate(path) for path, _ in clip_ranges]
+    frame_rate = max(frame_rates)
+    if min(frame_rates) != frame_rate:
+        print(f"Clips have different frame rates; encoding the reel at {frame_rate:g} fps.")
+
+    missing_audio = [path for path, _ in clip_ranges if not has_audio_stream(path)]
+    with_audio = not missing_audio
+    if missing_audio and len(missing_audio) < len(clip_ranges):
+        print(f"Dropping audio from the reel; no audio stream in: {', '.join(missing_audio)}")
+
+    command = ['ffmpeg']
+    filters = []
+    segments = []
+    for index, (path, ranges) in enumerate(clip_ranges):
+        command += ['-i', path]
+        for start, end in ranges:
+            n = len(segments)
+            filters.append(f"[{index}:v]trim=start={start:.6f}:end={end:.6f},setpts=PTS-STARTPTS[v{n}]")
+            if with_audio:
+                filters.append(f"[{index}:a]atrim=start={start:.6f}:end={end:.6f},asetpts=PTS-STARTPTS[a{n}]")
+                segments.append(f"[v{n}][a{n}]")
+            else:
+                segments.append(f"[v{n}]")
+
+    outputs = '[outv][outa]' if with_audio else '[outv]'
+    filters.append(f"{''.join(segments)}concat=n={len(segments)}:v=1:a={int(with_audio)}{outputs}")
+
+    command += [
+        '-filter_complex', ';'.join(filters),
+        '-map', '[outv]',
+        # The concat filter drops the input frame rate, so set it explicitly or
+        # FFmpeg falls back to 25 fps and drops frames.
+        '-r', str(frame_rate),
+        '-c:v', 'libx264',
+        '-preset', 'veryfast',
+        '-crf', '18',
+        '-pix_fmt', 'yuv420p'
+    ]
+    if with_audio:
+        command += ['-map', '[outa]', '-c:a', 'aac', '-b:a', '192k']
+    command += ['-y', output_path]
+
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def stitch_clips(clip_paths, output_path, cleanup=True, remove_dead_frames=False):
     """
     Stitches multiple video clips into a single video file using FFmpeg.
+
+    With remove_dead_frames, each clip is scanned for black, frozen and duplicate
+    frames first. If any are found the kept ranges are re-encoded, otherwise the
+    clips are still joined with stream copy. Needs NumPy.
     """
     if not clip_paths:
         print("No clips to stitch.")
         return
 
+    stitch_paths = clip_paths
+    if remove_dead_frames:
+        from dead_frame_detector import detect_dead_segments, merge_segments, invert_ranges
+
+        clip_ranges = []
+        has_cuts = False
+        for path in clip_paths:
+            result = detect_dead_segments(path)
+            cut_ranges = merge_segments(result['segments'])
+            keep_ranges = invert_ranges(cut_ranges, result['duration'])
+            if not keep_ranges:
+                print(f"Skipping {path}: no usable frames found.")
+                continue
+            if cut_ranges:
+                has_cuts = True
+                print(f"Cutting {len(cut_ranges)} dead segment(s) from {path}")
+            clip_ranges.append((path, keep_ranges))
+
+        if not clip_ranges:
+            print("No usable frames left to stitch.")
+            return
+
+        if has_cuts:
+            stitch_ranges(clip_ranges, output_path)
+            if cleanup:
+                for path in clip_paths:
+                    os.remove(path)
+            return
+        stitch_paths = [path for path, _ in clip_ranges]
+
     # Create the temporary file list for ffmpeg
     list_path = os.path.join(os.path.dirname(output_path), "clips_to_stitch.txt")
     with open(list_path, 'w') as f:
-        for path in clip_paths:
+        for path in stitch_paths:
             # FFmpeg requires forward slashes and escaped special characters
             safe_path = path.replace('\\', '/')
             f.write(f"file '{safe_path}'\n")